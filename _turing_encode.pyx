@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled pixel conversion for the Turing Smart Screen module.
+
+This is an optional accelerator for turing_smart_screen; when it is not built
+the conversion is performed with NumPy, or in Python. It can be built in place
+with:
+
+    cythonize -i _turing_encode.pyx
+"""
+
+cpdef void encode(const unsigned char[::1] src, unsigned char[::1] dst, bint big_endian):
+    """
+    Convert 8 bit RGB data into the 16 bit RGB565 format used by the display.
+
+    @param src:         Buffer of 8 bit (R, G, B) values, 3 bytes per pixel
+    @param dst:         Buffer to write 2 bytes per pixel to
+    @param big_endian:  Whether the 16 bit pixels are big endian
+    """
+    cdef Py_ssize_t count = min(src.shape[0] // 3, dst.shape[0] // 2)
+    cdef Py_ssize_t i
+    cdef const unsigned char *rgb
+    cdef unsigned char *out
+
+    if count == 0:
+        return
+
+    rgb = &src[0]
+    out = &dst[0]
+    with nogil:
+        # Each byte of the pixel is built from the components with byte-sized
+        # operations and no branches, so that the C compiler can vectorise
+        # the loops.
+        if big_endian:
+            for i in range(count):
+                out[i * 2] = (rgb[i * 3] & 0xF8) | (rgb[i * 3 + 1] >> 5)
+                out[i * 2 + 1] = ((rgb[i * 3 + 1] << 3) & 0xE0) | (rgb[i * 3 + 2] >> 3)
+        else:
+            for i in range(count):
+                out[i * 2] = ((rgb[i * 3 + 1] << 3) & 0xE0) | (rgb[i * 3 + 2] >> 3)
+                out[i * 2 + 1] = (rgb[i * 3] & 0xF8) | (rgb[i * 3 + 1] >> 5)
@@ -40,10 +40,68 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import itertools
 import struct
-import sys
+import threading
 import time
 
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+# We need a clock which won't jump, for timing the delays between commands.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it the pixel conversion is performed in Python.
+    np = None
+
+try:
+    import _turing_encode
+except ImportError:
+    # The compiled pixel conversion is optional; see _turing_encode.pyx.
+    _turing_encode = None
+
+try:
+    import numba
+except ImportError:
+    # Numba is optional; if present, it compiles the pixel conversion.
+    numba = None
+
+
+if np is not None and numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def _numba_encode(src, dst, big_endian):
+        """
+        Convert 8 bit RGB data into the 16 bit RGB565 format used by the display.
+
+        @param src:         Array of rows of 8 bit (R, G, B) values; any strides are allowed
+        @param dst:         Array of bytes to write 2 bytes per pixel to; conversion stops
+                            when it is full
+        @param big_endian:  Whether the 16 bit pixels are big endian
+        """
+        # Bounds aren't checked, so we must never write beyond the output.
+        end = (dst.shape[0] // 2) * 2
+        i = 0
+        for row in range(src.shape[0]):
+            for col in range(src.shape[1]):
+                if i >= end:
+                    return
+                pix = ((src[row, col, 0] & 0xF8) << 8) | ((src[row, col, 1] & 0xFC) << 3) | (src[row, col, 2] >> 3)
+                if big_endian:
+                    dst[i] = pix >> 8
+                    dst[i + 1] = pix & 0xFF
+                else:
+                    dst[i] = pix & 0xFF
+                    dst[i + 1] = pix >> 8
+                i += 2
+else:
+    _numba_encode = None
+
 
 class TuringError(Exception):
     """
@@ -67,7 +125,7 @@ class TuringNotImplementedError(TuringError, NotImplementedError):
 
 
 class TuringDisplayBase(object):
-    # Portrait is the default; landscape is not implemented in variant 1.
+    # Portrait is the default; variant 1 rotates landscape content in software.
     ORIENTATION_PORTRAIT = 0
     ORIENTATION_LANDSCAPE = 1
 
@@ -82,15 +140,54 @@ class TuringDisplayBase(object):
 
     INTER_BITMAP_DELAY = 0.02
 
+    # The end of the delay is timed by polling, as sleeps may overrun by a few ms
+    INTER_BITMAP_SPIN = 0.002
+
+    # Byte order of the 16 bit pixel data sent to the display
+    BIG_ENDIAN = False
+
+    # Number of commands that may be waiting for the writer thread
+    WRITER_QUEUE_SIZE = 4
+
+    # Sizes of the serial buffers to request from the operating system
+    DEVICE_RX_BUFFER_SIZE = 4096
+    DEVICE_TX_BUFFER_SIZE = 65536
+
+    # Number of rows of pixels converted at a time with NumPy
+    ENCODE_STRIP_ROWS = 128
+
+    # Contribution of each 8 bit component value to a 16 bit RGB565 pixel
+    RGB565_RED = tuple((i >> 3) << 11 for i in range(256))
+    RGB565_GREEN = tuple((i >> 2) << 5 for i in range(256))
+    RGB565_BLUE = tuple(i >> 3 for i in range(256))
+
+    # Contribution of each 8 bit component value to the high and low bytes of
+    # an RGB565 pixel, for use with Pillow's Image.point
+    RGB565_HIGH_RED = [i & 0xF8 for i in range(256)]
+    RGB565_HIGH_GREEN = [i >> 5 for i in range(256)]
+    RGB565_LOW_GREEN = [(i << 3) & 0xE0 for i in range(256)]
+    RGB565_LOW_BLUE = [i >> 3 for i in range(256)]
+
     def __init__(self, device):
         self.device = device
 
+        # A larger transmit buffer means that we block less often whilst
+        # writing the bitmap data. Only some serial implementations (such as
+        # pyserial on Windows) are able to change this.
+        if hasattr(device, 'set_buffer_size'):
+            device.set_buffer_size(rx_size=self.DEVICE_RX_BUFFER_SIZE,
+                                   tx_size=self.DEVICE_TX_BUFFER_SIZE)
+
         # We remember the orientation so that we can change our coordinates.
         self._orientation = self.ORIENTATION_PORTRAIT
 
         # Inversion is implemented internally
         self._invert = 0
 
+        # Whether landscape content must be rotated for the display, if it
+        # cannot change orientation itself.
+        self._rotate = False
+
         # We remember the brightness so that we might simulate the display off.
         self._brightness = 0
 
@@ -106,6 +203,163 @@ class TuringDisplayBase(object):
         # in parallel with that delay.
         self.last_bitmap_time = 0
 
+        # The last frame sent by update_frame, if nothing has been drawn since.
+        self._last_frame = None
+
+        # Buffer for the bitmap data, kept between updates; see send_bitmap.
+        self._bitmap_buffer = None
+
+        # Commands may be written by a background thread; see start_writer.
+        self._writer = None
+        self._writer_queue = None
+        self._writer_error = None
+
+    def wait_for_bitmap(self):
+        """
+        Wait until the delay required after sending bitmap data has passed.
+        """
+        # The delay only runs from the end of the last bitmap, so any work done
+        # by the caller since then has already counted towards it.
+        deadline = self.last_bitmap_time + self.inter_bitmap_delay
+        remaining = deadline - _monotonic()
+        if remaining > self.INTER_BITMAP_SPIN:
+            time.sleep(remaining - self.INTER_BITMAP_SPIN)
+        while _monotonic() < deadline:
+            pass
+
+    def command_frame(self, cmd, payload=None):
+        """
+        Construct the bytes to send to the display for a command.
+
+        @param cmd:     Command number to send
+        @param payload: List of parameter values for the command, or None for none
+
+        @return: bytes containing the command
+        """
+        raise TuringNotImplementedError("{}.command_frame is not implemented".format(self.__class__.__name__))
+
+    def send_command(self, cmd, payload=None):
+        """
+        Send a command to the display.
+
+        @param cmd:     Command number to send
+        @param payload: List of parameter values for the command, or None for none
+        """
+        self.send_frame(self.command_frame(cmd, payload))
+
+    def send_bitmap(self, header, rgb_data, count, encoded=False):
+        """
+        Send a bitmap update command to the display, followed by its pixel data.
+
+        The command and the pixel data are built in a single buffer and written in one
+        operation, leaving the serial driver to split it up for the device.
+
+        @param header:      Values for BITMAP_STRUCT, from bitmap_header
+        @param rgb_data:    Pixel data from rgb_buffer, or None to send black pixels
+        @param count:       Number of pixels to send
+        @param encoded:     Whether rgb_data has already been converted to RGB565 data
+                            in the byte order of the display
+        """
+        # Anything drawn means we no longer know what the whole display holds.
+        self._last_frame = None
+
+        size = self.BITMAP_STRUCT.size
+        length = size + count * 2
+        if self._writer is None and rgb_data is not None:
+            # The frame has been written by the time we return, so the same
+            # buffer can be used for each bitmap; it only grows if it must.
+            if self._bitmap_buffer is None or len(self._bitmap_buffer) < length:
+                self._bitmap_buffer = bytearray(length)
+            data = memoryview(self._bitmap_buffer)[:length]
+        else:
+            # Queued frames need their own buffer, as do black pixels, which
+            # rely on the buffer starting as zeros.
+            data = memoryview(bytearray(length))
+
+        self.BITMAP_STRUCT.pack_into(data, 0, *header)
+        if encoded:
+            data[size:] = rgb_data[:count * 2]
+        elif rgb_data is not None:
+            self.encode_rgb565(rgb_data, count, data[size:])
+        self.send_frame(data, bitmap=True)
+
+    def send_frame(self, frame, bitmap=False):
+        """
+        Send a constructed command to the display.
+
+        If the writer thread is running, the command is queued for it to write.
+
+        @param frame:   bytes containing the command, and any data which follows it
+        @param bitmap:  Whether the command sends bitmap data
+        """
+        if self._writer is not None:
+            self.check_writer()
+            self._writer_queue.put((frame, bitmap))
+        else:
+            self.write_frame(frame, bitmap)
+
+    def write_frame(self, frame, bitmap=False):
+        """
+        Write a constructed command to the display device.
+
+        @param frame:   bytes containing the command, and any data which follows it
+        @param bitmap:  Whether the command sends bitmap data
+        """
+        # See whether we need to wait before issuing the next command.
+        # If we don't wait, we get a corrupted display.
+        self.wait_for_bitmap()
+
+        self.device.write(frame)
+
+        if bitmap:
+            # A delay is required between sending the data and the next command.
+            self.last_bitmap_time = _monotonic()
+
+    def start_writer(self):
+        """
+        Start a background thread to write commands to the display.
+
+        Commands are then queued for the thread to write, so that the caller can prepare
+        the next update whilst the last is being sent to the display.
+        """
+        if self._writer is None:
+            self._writer_queue = queue.Queue(self.WRITER_QUEUE_SIZE)
+            self._writer_error = None
+            self._writer = threading.Thread(target=self._writer_thread, name='TuringDisplayWriter')
+            self._writer.daemon = True
+            self._writer.start()
+
+    def stop_writer(self):
+        """
+        Stop the background writer thread, once everything queued has been written.
+        """
+        if self._writer is not None:
+            self._writer_queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self.check_writer()
+
+    def check_writer(self):
+        """
+        Report any failure to write to the display from the background writer thread.
+        """
+        exc = self._writer_error
+        if exc is not None:
+            self._writer_error = None
+            raise exc
+
+    def _writer_thread(self):
+        while True:
+            item = self._writer_queue.get()
+            if item is None:
+                return
+            try:
+                # Once a write has failed, discard everything until it has been reported.
+                if self._writer_error is None:
+                    self.write_frame(*item)
+            except Exception as exc:
+                self._writer_error = exc
+
     @property
     def width(self):
         """
@@ -125,9 +379,11 @@ class TuringDisplayBase(object):
         Clear the display to black.
         """
         # If it's not implemented we can clear the display if we know the
-        # orientation by writing a full screen of 0.
-        blank = [(0, 0, 0)] * (self.WIDTH * self.HEIGHT)
-        self.update_region(0, 0, self.width, self.height, blank)
+        # orientation by writing a full screen of 0. Black is 0 in any pixel
+        # format, so there's no need to convert any data.
+        (x, y, width, height) = self.rotate_position(0, 0, self.width, self.height)
+        header = self.bitmap_header(x, y, width, height)
+        self.send_bitmap(header, None, self.WIDTH * self.HEIGHT)
 
     def orientation(self, state):
         """
@@ -136,6 +392,7 @@ class TuringDisplayBase(object):
         @param state: Orientation to apply (ORIENTATION_PORTRAIT or ORIENTATION_LANDSCAPE)
         """
         self._orientation = state
+        self._last_frame = None
         raise TuringNotImplementedError("{}.orientation is not implemented".format(self.__class__.__name__))
 
     def invert(self, state):
@@ -145,6 +402,7 @@ class TuringDisplayBase(object):
         @param state:       0, INVERT_X, INVERT_Y or INVERT_Y to change the inversion state of content.
         """
         self._invert = state
+        self._last_frame = None
 
     def backlight(self, red, green, blue):
         """
@@ -180,11 +438,44 @@ class TuringDisplayBase(object):
 
         @param x, y:            Top left coordinates to plot at
         @param width, height:   Size of the data supplied
-        @param rgb:             List of pixel values in tuples of 8 bit (R, G, B) values,
-                                in row-major format (ie across the width, first)
+        @param rgb_data:        bytes-like packed 8 bit R, G, B values, or a NumPy array
+                                of shape (height, width, 3), in row-major format (ie
+                                across the width, first). A list, or other iterable, of
+                                (R, G, B) tuples is also accepted, but is deprecated as it
+                                is much slower.
+
+        @note: The caller is responsible for supplying enough data for the region; this
+               is only checked when assertions are enabled.
+        """
+        rgb_data = self.rgb_buffer(width, height, rgb_data)
+        (x, y, width, height, rgb_data) = self.apply_inversion(x, y, width, height, rgb_data)
+        (x, y, width, height, rgb_data) = self.apply_rotation(x, y, width, height, rgb_data)
+
+        header = self.bitmap_header(x, y, width, height)
+        self.send_bitmap(header, rgb_data, width * height)
+
+    def bitmap_header(self, x, y, width, height):
+        """
+        Construct the command to update a region of the display.
+
+        @param x, y:            Top left coordinates to plot at, on the display
+        @param width, height:   Size of the region
+
+        @return: Tuple of values to pack with BITMAP_STRUCT
         """
         raise TuringNotImplementedError("{}.update_region is not implemented".format(self.__class__.__name__))
 
+    def update_region_bytes(self, x, y, width, height, rgb888_data):
+        """
+        Update a region of the display with packed RGB data.
+
+        @param x, y:            Top left coordinates to plot at
+        @param width, height:   Size of the data supplied
+        @param rgb888_data:     bytes, bytearray or memoryview containing 3 bytes for each
+                                pixel, as 8 bit R, G, B values, in row-major format
+        """
+        self.update_region(x, y, width, height, rgb888_data)
+
     def update_region_pillow(self, x, y, image, x0=0, y0=0, width=None, height=None):
         """
         Helper function to update the region using whole PIL/Pillow image.
@@ -193,61 +484,152 @@ class TuringDisplayBase(object):
         @param x0, y0:          Source position to take from in the image
         @param width, height:   Size of the data to plot
 
-        @note: Assumes that the data is in the format RGB, RGBX, RGBA or RGBa.
-               Alpha channel is ignored.
+        @note: Images which are not RGB are converted to RGB before use, so
+               any alpha channel is ignored.
         """
-
-        full_data = image.load()
-
         if width is None:
             width = image.size[0]
         if height is None:
             height = image.size[1]
 
-        x1 = max(x0 + width, image.size[0])
-        y1 = max(y0 + height, image.size[1])
-
-        # Extract the data region from the image supplied into the tuple format
-        # we support. It happens that the return from Pillow is accessible as an
-        # indexed R, G, B value, so there's no need to create a separate tuple.
-        rgb_data = []
-
-        if image.mode == 'P':
-            # Paletted image data.
-            # We must convert this to RGB data.
-            palette = image.palette
-            if palette.mode in ('RGBA', 'RGB'):
-                # The data here appears to only be RGB, even through the mode was given as RGBA.
-                palette_data = palette.getdata()[1]
-                palette = bytearray(palette_data)
-                entries = int(len(palette_data) / 3)
-                palette = [tuple(bytearray(palette_data[n * 3:n * 3 + 3])) for n in range(entries)]
+        x1 = min(x0 + width, image.size[0])
+        y1 = min(y0 + height, image.size[1])
+        if x1 <= x0 or y1 <= y0:
+            # None of the image lies within the region requested.
+            return
+
+        # Only the region we need is taken from the image, and converted to RGB
+        # if it is in any other format. Pillow does each of these in one pass,
+        # and then gives us the packed RGB data directly.
+        if (x0, y0, x1, y1) != (0, 0, image.size[0], image.size[1]):
+            image = image.crop((x0, y0, x1, y1))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        if np is None and _turing_encode is None:
+            # Without a faster encoder, Pillow can perform the conversion for us,
+            # which is much quicker than doing it in Python.
+            self.update_region_pillow_rgb565(x, y, image)
+        else:
+            self.update_region_bytes(x, y, x1 - x0, y1 - y0, image.tobytes())
+
+    def update_region_pillow_rgb565(self, x, y, image):
+        """
+        Update a region of the display with an RGB image, using Pillow to convert it.
+
+        @param x, y:            Top left coordinates to plot at
+        @param image:           PIL/Pillow image in RGB mode
+        """
+        from PIL import Image, ImageChops
+
+        (width, height) = image.size
+        if self._invert == self.INVERT_XY:
+            image = image.transpose(Image.ROTATE_180)
+        elif self._invert == self.INVERT_X:
+            image = image.transpose(Image.FLIP_LEFT_RIGHT)
+        elif self._invert == self.INVERT_Y:
+            image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        (x, y) = self.invert_position(x, y, width, height)
+        if self._rotate:
+            image = image.transpose(Image.ROTATE_270)
+            (x, y, width, height) = self.rotate_position(x, y, width, height)
+
+        # Each byte of the pixel is built from the components separately; the
+        # bits they contribute don't overlap, so adding them combines them.
+        (red, green, blue) = image.split()
+        high = ImageChops.add(red.point(self.RGB565_HIGH_RED), green.point(self.RGB565_HIGH_GREEN))
+        low = ImageChops.add(green.point(self.RGB565_LOW_GREEN), blue.point(self.RGB565_LOW_BLUE))
+        if self.BIG_ENDIAN:
+            rgb565_data = Image.merge('LA', (high, low)).tobytes()
+        else:
+            rgb565_data = Image.merge('LA', (low, high)).tobytes()
+
+        header = self.bitmap_header(x, y, width, height)
+        self.send_bitmap(header, rgb565_data, width * height, encoded=True)
+
+    def update_frame(self, rgb_data):
+        """
+        Update the whole display, sending only the region which has changed since the last frame.
+
+        @param rgb_data:        Pixel data for the whole display, in the orientation selected,
+                                in any of the forms accepted by update_region
+
+        @note: The last frame is only known if it was sent with update_frame; any other
+               change to the display means that the next frame is sent in full.
+        """
+        width = self.width
+        height = self.height
+        rgb_data = self.rgb_buffer(width, height, rgb_data)
+
+        last_frame = self._last_frame
+        self._last_frame = None
+
+        if np is not None and isinstance(rgb_data, np.ndarray):
+            # Keep our own copy, as the caller may reuse their buffer.
+            frame = np.array(rgb_data.reshape(-1, rgb_data.shape[-1])[:width * height, :3]).reshape(height, width, 3)
+            if last_frame is None:
+                self.update_region(0, 0, width, height, frame)
             else:
-                raise TuringNotImplementedError("Pillow palette mode '{}' is not supported".format(palette.mode))
-
-            for row in range(y0, y1):
-                for col in range(x0, x1):
-                    pal = full_data[col, row]
-                    colour = palette[pal] if pal < len(palette) else (0, 0, 0)
-                    rgb_data.append(colour)
-
-                    # Diagnostics, if you need them:
-                    #if colour == (0, 0, 0):
-                    #    sys.stdout.write(' ')
-                    #else:
-                    #    brightness = int((colour[0] + colour[1] + colour[2]) / (256.0 * 3 / 10))
-                    #    sys.stdout.write(chr(48 + brightness))
-                #sys.stdout.write("\n")
-
-        elif image.mode in ('RGB', 'RGBA', 'RGBX', 'RGBa'):
-            # RGB format images
-            for row in range(y0, y1):
-                for col in range(x0, x1):
-                    rgb_data.append(full_data[col, row])
+                changed = np.any(frame != last_frame, axis=2)
+                rows = np.flatnonzero(changed.any(axis=1))
+                if len(rows):
+                    cols = np.flatnonzero(changed.any(axis=0))
+                    (x0, x1) = (int(cols[0]), int(cols[-1]) + 1)
+                    (y0, y1) = (int(rows[0]), int(rows[-1]) + 1)
+                    self.update_region(x0, y0, x1 - x0, y1 - y0, frame[y0:y1, x0:x1])
+
         else:
-            raise TuringNotImplementedError("Pillow image mode '{}' is not supported".format(image.mode))
+            frame = bytes(rgb_data[:width * height * 3])
+            if last_frame is None:
+                self.update_region(0, 0, width, height, frame)
+            else:
+                # Without NumPy, comparing rows is cheap but finding the changed
+                # columns is not, so we send whole rows.
+                stride = width * 3
+                rows = [row for row in range(height)
+                        if frame[row * stride:(row + 1) * stride] != last_frame[row * stride:(row + 1) * stride]]
+                if rows:
+                    (y0, y1) = (rows[0], rows[-1] + 1)
+                    self.update_region(0, y0, width, y1 - y0, frame[y0 * stride:y1 * stride])
+
+        self._last_frame = frame
+
+    def rgb_buffer(self, width, height, rgb_data):
+        """
+        Convert RGB data into a form which can be processed without handling each pixel.
 
-        self.update_region(x, y, x1 - x0, y1 - y0, rgb_data)
+        @param width, height:   Size of the data supplied
+        @param rgb_data:        bytes-like packed 8 bit R, G, B values, or a NumPy array
+                                of shape (height, width, 3), in row-major format (ie
+                                across the width, first). A list, or other iterable, of
+                                (R, G, B) tuples is also accepted, but is deprecated as it
+                                is much slower.
+
+        @return: NumPy array of shape (height, width, channels) if NumPy is available,
+                 otherwise bytes-like packed data
+        """
+        if np is not None and isinstance(rgb_data, np.ndarray):
+            pixels = rgb_data.size // rgb_data.shape[-1]
+        else:
+            if isinstance(rgb_data, memoryview) and rgb_data.ndim != 1:
+                # Views of multi-dimensional buffers are read as packed bytes.
+                rgb_data = rgb_data.cast('B')
+            elif not isinstance(rgb_data, (bytes, bytearray, memoryview)):
+                # Tuples are flattened into packed data in a single pass.
+                rgb_data = bytearray(itertools.chain.from_iterable(rgb_data))
+            pixels = len(rgb_data) // 3
+            if np is not None:
+                # Use the buffer as an array of pixels, without copying it.
+                rgb_data = np.frombuffer(rgb_data, dtype=np.uint8)[:width * height * 3].reshape(-1, 3)
+
+        assert pixels >= width * height, "Not enough data supplied to update region of {}x{} (only {} pixels present)".format(width, height, pixels)
+
+        if np is not None and rgb_data.shape[:-1] != (height, width):
+            # Only the pixels for the region are used, arranged in its rows, so that
+            # inversion, rotation and conversion all work on exactly the same data.
+            channels = rgb_data.shape[-1]
+            rgb_data = rgb_data.reshape(-1, channels)[:width * height].reshape(height, width, channels)
+        return rgb_data
 
     def apply_inversion(self, x, y, width, height, rgb_data):
         """
@@ -255,8 +637,7 @@ class TuringDisplayBase(object):
 
         @param x, y:            Top left coordinates to plot at
         @param width, height:   Size of the data supplied
-        @param rgb_data:        List of pixel values in tuples of 8 bit (R, G, B) values,
-                                in row-major format (ie across the width, first)
+        @param rgb_data:        Pixel data from rgb_buffer
 
         @return: Tuple of updated parameters in the form: (x, y, width, height, rgb_data)
         """
@@ -266,35 +647,162 @@ class TuringDisplayBase(object):
         # They want this data inverted in some way, so we need to reverse the order of the rows
         # and update the position.
 
-        x1 = x + width
-        y1 = y + height
-
-        # Invert the row data.
-        new_rgb_data = []
-        if self._invert == self.INVERT_Y:
-            offset = height * width
-            for row in range(height):
-                offset -= width
-                new_rgb_data.extend(rgb_data[offset:offset + width])
-        elif self._invert == self.INVERT_XY:
-            offset = height * width
-            for row in range(height):
-                offset -= width
-                new_rgb_data.extend(reversed(rgb_data[offset:offset + width]))
+        if np is not None and isinstance(rgb_data, np.ndarray):
+            # Flipping an array only changes the strides used to access it, so
+            # no data is copied until it is converted for sending.
+            step_x = -1 if self._invert in (self.INVERT_X, self.INVERT_XY) else 1
+            step_y = -1 if self._invert in (self.INVERT_Y, self.INVERT_XY) else 1
+            rgb_data = rgb_data[::step_y, ::step_x]
+
         else:
-            for offset in range(0, width * height, width):
-                newdata = reversed(rgb_data[offset:offset + width])
-                new_rgb_data.extend(newdata)
+            # The packed data is rearranged with slices, which still avoids
+            # handling each pixel in Python.
+            rgb_data = bytearray(rgb_data[:width * height * 3])
+            if self._invert in (self.INVERT_X, self.INVERT_XY):
+                # Reversing the order of all the pixels flips both axes.
+                new_rgb_data = bytearray(len(rgb_data))
+                new_rgb_data[0::3] = rgb_data[-3::-3]
+                new_rgb_data[1::3] = rgb_data[-2::-3]
+                new_rgb_data[2::3] = rgb_data[-1::-3]
+                rgb_data = new_rgb_data
+            if self._invert in (self.INVERT_X, self.INVERT_Y):
+                # Reversing the order of the rows flips vertically, which either
+                # gives us the vertical inversion, or undoes it for horizontal.
+                stride = width * 3
+                rgb_data = bytearray().join(rgb_data[row * stride:(row + 1) * stride]
+                                            for row in range(height - 1, -1, -1))
+
+        (x, y) = self.invert_position(x, y, width, height)
+        return (x, y, width, height, rgb_data)
 
-        rgb_data = new_rgb_data
+    def invert_position(self, x, y, width, height):
+        """
+        Update the position of a region for the invert parameter.
+
+        @param x, y:            Top left coordinates to plot at
+        @param width, height:   Size of the region
+
+        @return: Tuple of the top left coordinates on the display, in the form: (x, y)
+        """
         if self._invert in (self.INVERT_Y, self.INVERT_XY):
-            (y1, y) = (self.height - y, self.height - y1)
+            y = self.height - (y + height)
 
         if self._invert in (self.INVERT_X, self.INVERT_XY):
-            (x1, x) = (self.width - x, self.width - x1)
+            x = self.width - (x + width)
+
+        return (x, y)
+
+    def apply_rotation(self, x, y, width, height, rgb_data):
+        """
+        Update the RGB data and position for a display which cannot change orientation itself.
+
+        @param x, y:            Top left coordinates to plot at
+        @param width, height:   Size of the data supplied
+        @param rgb_data:        Pixel data from apply_inversion
 
+        @return: Tuple of updated parameters in the form: (x, y, width, height, rgb_data)
+        """
+        if not self._rotate:
+            return (x, y, width, height, rgb_data)
+
+        # Landscape content is turned a quarter clockwise onto the display, so
+        # each row that we send is a column of the data, read from the bottom.
+        if np is not None and isinstance(rgb_data, np.ndarray):
+            # As with inversion, this only changes the strides of the array, so
+            # the rotation happens as the data is converted for sending.
+            rgb_data = rgb_data[::-1].transpose(1, 0, 2)
+
+        else:
+            # Each component of a column can be taken with a single slice.
+            if isinstance(rgb_data, memoryview):
+                # Python 2 cannot slice memoryviews with a step.
+                rgb_data = rgb_data.tobytes()
+            stride = width * 3
+            last_row = (height - 1) * stride
+            new_rgb_data = bytearray(width * height * 3)
+            for column in range(width):
+                start = column * height * 3
+                end = start + height * 3
+                for component in range(3):
+                    new_rgb_data[start + component:end:3] = rgb_data[last_row + column * 3 + component::-stride]
+            rgb_data = new_rgb_data
+
+        (x, y, width, height) = self.rotate_position(x, y, width, height)
         return (x, y, width, height, rgb_data)
 
+    def rotate_position(self, x, y, width, height):
+        """
+        Update the position of a region for a display which cannot change orientation itself.
+
+        @param x, y:            Top left coordinates to plot at
+        @param width, height:   Size of the region
+
+        @return: Tuple of the region on the display, in the form: (x, y, width, height)
+        """
+        if not self._rotate:
+            return (x, y, width, height)
+
+        return (self.WIDTH - (y + height), x, height, width)
+
+    def encode_rgb565(self, rgb_data, count, out):
+        """
+        Convert RGB data into the 16 bit RGB565 format used by the display.
+
+        @param rgb_data:        Pixel data from rgb_buffer, which is an array of shape
+                                (height, width, channels) if NumPy is available
+        @param count:           Number of pixels to convert
+        @param out:             Writable buffer of 2 bytes per pixel to write the data to
+
+        @return: The buffer containing 2 bytes per pixel, in the byte order of the display
+        """
+        if np is not None:
+            arr = np.asarray(rgb_data, dtype=np.uint8)
+            if _turing_encode is not None:
+                # Any alpha channel that is present is ignored.
+                rgb = np.ascontiguousarray(arr.reshape(-1, arr.shape[-1])[:count, :3]).reshape(-1)
+                _turing_encode.encode(rgb, out, self.BIG_ENDIAN)
+                return out
+
+            if _numba_encode is not None:
+                # The compiled code can follow the strides of inverted data.
+                _numba_encode(arr, np.frombuffer(out, dtype=np.uint8, count=count * 2), self.BIG_ENDIAN)
+                return out
+
+            # The conversion is performed on strips of rows, so that the
+            # intermediate values stay in the cache.
+            step = self.ENCODE_STRIP_ROWS
+            pixel_data = np.frombuffer(out, dtype='>u2' if self.BIG_ENDIAN else '<u2', count=count)
+            offset = 0
+            for start in range(0, len(arr), step):
+                strip = arr[start:start + step].reshape(-1, arr.shape[-1])[:count - offset]
+                # Masking the components before they are widened means that each
+                # needs only a single shift to reach its position in the pixel.
+                pix = (strip[:, 0] & 0xF8).astype(np.uint16) << 8
+                pix |= (strip[:, 1] & 0xFC).astype(np.uint16) << 3
+                pix |= strip[:, 2] >> 3
+                pixel_data[offset:offset + len(pix)] = pix
+                offset += len(pix)
+                if offset >= count:
+                    break
+            return out
+
+        if _turing_encode is not None:
+            _turing_encode.encode(memoryview(rgb_data)[:count * 3], out, self.BIG_ENDIAN)
+            return out
+
+        # The component lookups replace the shifts on each pixel, and then
+        # all the pixels are packed into the buffer by a single struct call,
+        # which also puts them in the byte order of the display.
+        red = self.RGB565_RED
+        green = self.RGB565_GREEN
+        blue = self.RGB565_BLUE
+        data = rgb_data if isinstance(rgb_data, bytearray) else bytearray(rgb_data)
+        end = count * 3
+        pixel_data = [red[r] | green[g] | blue[b]
+                      for (r, g, b) in zip(data[0:end:3], data[1:end:3], data[2:end:3])]
+        struct.pack_into('{}{}H'.format('>' if self.BIG_ENDIAN else '<', count), out, 0, *pixel_data)
+        return out
+
 
 class TuringDisplayVariant1(TuringDisplayBase):
     """
@@ -309,32 +817,43 @@ class TuringDisplayVariant1(TuringDisplayBase):
     CMD_SET_BRIGHTNESS = 110
     CMD_UPDATE_BITMAP = 197
 
-    def send_command(self, cmd, payload=None):
-        if payload is None:
-            payload = [0] * 5
-        if len(payload) < 5:
-            payload = list(payload) + [0] * (5 - len(payload))
-
-        data = bytearray()
-        data.extend(payload)
-        data.append(cmd)
+    # Commands are 5 bytes of parameters, followed by the command
+    COMMAND_STRUCT = struct.Struct('6B')
+    # Bitmap updates have their coordinates packed into the first 5 bytes
+    BITMAP_STRUCT = struct.Struct('>BIB')
 
-        # See whether we need to wait before issuing the next command.
-        # If we don't wait, we get a corrupted display.
-        elapsed = time.time() - self.last_bitmap_time
-        if elapsed < self.inter_bitmap_delay:
-            time.sleep(self.inter_bitmap_delay - elapsed)
+    # Commands which never change are constructed in advance
+    FRAME_CLEAR = COMMAND_STRUCT.pack(0, 0, 0, 0, 0, CMD_CLEAR)
+    FRAME_SCREEN_OFF = COMMAND_STRUCT.pack(0, 0, 0, 0, 0, CMD_SCREEN_OFF)
+    FRAME_SCREEN_ON = COMMAND_STRUCT.pack(0, 0, 0, 0, 0, CMD_SCREEN_ON)
 
-        self.device.write(bytes(data))
+    def command_frame(self, cmd, payload=None):
+        params = list(payload or ()) + [0] * 5
+        params[5:] = [cmd]
+        return self.COMMAND_STRUCT.pack(*params)
 
     def clear(self):
         """
         Clear the display to black.
         """
         # We have a command to clear the display directly
-        self.send_command(self.CMD_CLEAR)
+        self.send_frame(self.FRAME_CLEAR)
+        self._last_frame = None
+
+    def orientation(self, state):
+        """
+        Set the orientation of the data sent to the display.
+
+        This display cannot change orientation itself, so landscape content is
+        rotated as it is converted for sending.
+
+        @param state: Orientation to apply (ORIENTATION_PORTRAIT or ORIENTATION_LANDSCAPE)
+        """
+        assert state in (self.ORIENTATION_PORTRAIT, self.ORIENTATION_LANDSCAPE), "Orientation must be one of ORIENTATION_PORTRAIT or ORIENTATION_LANDSCAPE"
+        self._orientation = state
+        self._rotate = (state == self.ORIENTATION_LANDSCAPE)
+        self._last_frame = None
 
-    # No orientation implementation
     # No backlight implementation
 
     def enable(self, state):
@@ -347,9 +866,9 @@ class TuringDisplayVariant1(TuringDisplayBase):
 
         if self._enable != state:
             if state:
-                self.send_command(self.CMD_SCREEN_ON)
+                self.send_frame(self.FRAME_SCREEN_ON)
             else:
-                self.send_command(self.CMD_SCREEN_OFF)
+                self.send_frame(self.FRAME_SCREEN_OFF)
 
         self._enable = state
 
@@ -364,19 +883,15 @@ class TuringDisplayVariant1(TuringDisplayBase):
         # The brightness is inverted compared to what you might expect
         self.send_command(self.CMD_SET_BRIGHTNESS, payload=[255 - scale])
 
-    def update_region(self, x, y, width, height, rgb_data):
-        """
-        Update a region of the display with some RGB data.
-
-        @param x, y:            Top left coordinates to plot at
-        @param width, height:   Size of the data supplied
-        @param rgb_data:        List of pixel values in tuples of 8 bit (R, G, B) values,
-                                in row-major format (ie across the width, first)
+    def bitmap_header(self, x, y, width, height):
         """
-        assert len(rgb_data) >= width * height, "Not enough data supplied to update region of {}x{} (only {} pixels present)".format(width, height, len(rgb_data))
+        Construct the command to update a region of the display.
 
-        (x, y, width, height, rgb_data) = self.apply_inversion(x, y, width, height, rgb_data)
+        @param x, y:            Top left coordinates to plot at, on the display
+        @param width, height:   Size of the region
 
+        @return: Tuple of values to pack with BITMAP_STRUCT
+        """
         x1 = x + width - 1
         y1 = y + height - 1
 
@@ -386,40 +901,17 @@ class TuringDisplayVariant1(TuringDisplayBase):
         y = min(1023, y)
         y1 = min(1023, y1)
 
-        self.send_command(self.CMD_UPDATE_BITMAP,
-                          payload=[(x>>2),
-                                   ((x & 3) << 6) | (y >> 4),
-                                   ((y & 15) << 4) | (x1 >> 6),
-                                   ((x1 & 63) << 2) | (y1 >> 8),
-                                   y1 & 255])
-
-        # We want to write out reasonable chunk of data at a time so that it
-        # can be streaming out whilst we're accumulating more data.
-        flush_size = self.WIDTH * 8
-        accumulator = []
-        for start in range(0, width * height, flush_size):
-            for colour in rgb_data[start:start + flush_size]:
-                r = colour[0] >> 3
-                g = colour[1] >> 2
-                b = colour[2] >> 3
-                # Data is little endian
-                halfword = struct.pack('<H', (r<<11) | (g<<5) | b)
-                accumulator.append(halfword)
-
-            self.device.write(b''.join(accumulator))
-            accumulator = []
-
-        if accumulator:
-            self.device.write(b''.join(accumulator))
-
-        # A delay is required between sending the data and the next command.
-        self.last_bitmap_time = time.time()
+        # The four 10 bit coordinates are packed into 40 bits.
+        coords = (x << 30) | (y << 20) | (x1 << 10) | y1
+        return (coords >> 32, coords & 0xFFFFFFFF, self.CMD_UPDATE_BITMAP)
 
 
 class TuringDisplayVariant2(TuringDisplayBase):
     """
     This is the second variant of the display, labelled 'flagship' in seller's listing.
     """
+    # Pixel data is big endian
+    BIG_ENDIAN = True
 
     CMD_HELLO = 0xca
     CMD_SET_ORIENTATION = 0xcb
@@ -427,13 +919,22 @@ class TuringDisplayVariant2(TuringDisplayBase):
     CMD_SET_BACKLIGHT = 0xcd
     CMD_SET_BRIGHTNESS = 0xce
 
+    # Commands are framed by the command, with 8 bytes of parameters
+    COMMAND_STRUCT = struct.Struct('10B')
+    # Bitmap updates have big endian 16 bit coordinates
+    BITMAP_STRUCT = struct.Struct('>B4HB')
+
+    # Commands which never change are constructed in advance
+    FRAME_HELLO = struct.pack('B5s3xB', CMD_HELLO, b'HELLO', CMD_HELLO)
+    FRAME_BRIGHTNESS_OFF = COMMAND_STRUCT.pack(CMD_SET_BRIGHTNESS, 0, 0, 0, 0, 0, 0, 0, 0, CMD_SET_BRIGHTNESS)
+
     def __init__(self, device):
         super(TuringDisplayVariant2, self).__init__(device)
 
         # The variant 2 device has a protocol that responds when a 'HELLO'
         # packet is sent.
         hello = bytearray(b'HELLO')
-        self.send_command(self.CMD_HELLO, payload=hello)
+        self.send_frame(self.FRAME_HELLO)
 
         response = bytearray(device.read(10))
 
@@ -444,24 +945,10 @@ class TuringDisplayVariant2(TuringDisplayBase):
         if response[1:6] != hello:
             raise TuringError("TuringProtocolDisplay serial device not recognised (No HELLO; got %r)" % (response[1:6],))
 
-    def send_command(self, cmd, payload=None):
-        if payload is None:
-            payload = [0] * 8
-        if len(payload) < 8:
-            payload = list(payload) + [0] * (8 - len(payload))
-
-        data = bytearray(1)
-        data[0] = cmd
-        data.extend(payload)
-        data.append(cmd)
-
-        # See whether we need to wait before issuing the next command.
-        # If we don't wait, we get a corrupted display.
-        elapsed = time.time() - self.last_bitmap_time
-        if elapsed < self.inter_bitmap_delay:
-            time.sleep(self.inter_bitmap_delay - elapsed)
-
-        self.device.write(bytes(data))
+    def command_frame(self, cmd, payload=None):
+        params = [cmd] + list(payload or ()) + [0] * 8
+        params[9:] = [cmd]
+        return self.COMMAND_STRUCT.pack(*params)
 
     # clear is the software implementation
 
@@ -473,6 +960,7 @@ class TuringDisplayVariant2(TuringDisplayBase):
         """
         assert state in (self.ORIENTATION_PORTRAIT, self.ORIENTATION_LANDSCAPE), "Orientation must be one of ORIENTATION_PORTRAIT or ORIENTATION_LANDSCAPE"
         self._orientation = state
+        self._last_frame = None
 
         # The constants for portrait are the only one we can actually apply to the hardware.
         self.send_command(self.CMD_SET_ORIENTATION, payload=[state])
@@ -502,7 +990,7 @@ class TuringDisplayVariant2(TuringDisplayBase):
             if state:
                 self.send_command(self.CMD_SET_BRIGHTNESS, payload=[self._brightness])
             else:
-                self.send_command(self.CMD_SET_BRIGHTNESS, payload=[0])
+                self.send_frame(self.FRAME_BRIGHTNESS_OFF)
 
         self._enable = state
 
@@ -518,48 +1006,22 @@ class TuringDisplayVariant2(TuringDisplayBase):
             # Only send the display brightness if we're enabled
             self.send_command(self.CMD_SET_BRIGHTNESS, payload=[scale])
 
-    def update_region(self, x, y, width, height, rgb_data):
-        """
-        Update a region of the display with some RGB data.
-
-        @param x, y:            Top left coordinates to plot at
-        @param width, height:   Size of the data supplied
-        @param rgb_data:        List of pixel values in tuples of 8 bit (R, G, B) values,
-                                in row-major format (ie across the width, first)
+    def bitmap_header(self, x, y, width, height):
         """
-        assert len(rgb_data) >= width * height, "Not enough data supplied to update region of {}x{} (only {} pixels present)".format(width, height, len(rgb_data))
+        Construct the command to update a region of the display.
 
-        (x, y, width, height, rgb_data) = self.apply_inversion(x, y, width, height, rgb_data)
+        @param x, y:            Top left coordinates to plot at, on the display
+        @param width, height:   Size of the region
 
+        @return: Tuple of values to pack with BITMAP_STRUCT
+        """
         x1 = x + width - 1
         y1 = y + height - 1
-        self.send_command(self.CMD_UPDATE_BITMAP,
-                          payload=[(x>>8) & 255, (x & 255),
-                                   (y>>8) & 255, (y & 255),
-                                   (x1>>8) & 255, (x1 & 255),
-                                   (y1>>8) & 255, (y1 & 255)])
-
-        # We want to write out reasonable chunk of data at a time so that it
-        # can be streaming out whilst we're accumulating more data.
-        flush_size = self.WIDTH * 8
-        accumulator = []
-        for start in range(0, width * height, flush_size):
-            for colour in rgb_data[start:start + flush_size]:
-                r = colour[0] >> 3
-                g = colour[1] >> 2
-                b = colour[2] >> 3
-                # Data is big endian
-                halfword = struct.pack('>H', (r<<11) | (g<<5) | b)
-                accumulator.append(halfword)
-
-            self.device.write(b''.join(accumulator))
-            accumulator = []
-
-        if accumulator:
-            self.device.write(b''.join(accumulator))
-
-        # A delay is required between sending the data and the next command.
-        self.last_bitmap_time = time.time()
+
+        # Coordinates are wrapped into the 16 bits the command has for them.
+        return (self.CMD_UPDATE_BITMAP,
+                x & 0xFFFF, y & 0xFFFF, x1 & 0xFFFF, y1 & 0xFFFF,
+                self.CMD_UPDATE_BITMAP)
 
 
 def TuringDisplayAutoSelect(device):